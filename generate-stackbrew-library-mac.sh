@@ -104,7 +104,7 @@ for version; do
 			variantAliases=( "${variantAliases[@]//latest-/}" )
 		fi
 
-		parent="$(gawk 'toupper($1) == "FROM" { print $2 }' "$dir/Dockerfile")"
+		parent="$(gawk 'toupper($1) == "FROM" { print $2; exit }' "$dir/Dockerfile")"
 		arches="${parentRepoToArches[$parent]}"
 
 		suite="${parent#*:}" # "bookworm-slim", "bookworm"
@@ -98,7 +98,7 @@ for version; do
 			variantAliases=( "${variantAliases[@]//latest-/}" )
 		fi
 
-		parent="$(awk 'toupper($1) == "FROM" { print $2 }' "$dir/Dockerfile")"
+		parent="$(awk 'toupper($1) == "FROM" { print $2; exit }' "$dir/Dockerfile")"
 		arches="${parentRepoToArches[$parent]}"
 
 		suite="${parent#*:}" # "bookworm-slim", "bookworm"
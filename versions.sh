@@ -17,9 +17,8 @@ debian="$(
 export debian
 
 gosus="$(
-	git ls-remote --tags https://github.com/tianon/gosu.git \
+	git ls-remote --tags --refs https://github.com/tianon/gosu.git \
 		| cut -d/ -f3- \
-		| cut -d^ -f1 \
 		| grep -E '^[0-9]+' \
 		| sort -urV
 )"
@@ -152,4 +151,5 @@ for version in "${versions[@]}"; do
 	')"
 done
 
-jq <<<"$json" . > versions.json
+jq <<<"$json" . > versions.json.tmp
+mv versions.json.tmp versions.json